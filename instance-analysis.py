@@ -1,14 +1,26 @@
 import os
+import argparse
+import asyncio
+import functools
+import hashlib
+import time
+import httpx
+import orjson
 import requests
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from docx import Document
 from tqdm import tqdm
 import inquirer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s: %(message)s')
+# httpx logs every request at INFO, which would interleave with the progress bars
+logging.getLogger('httpx').setLevel(logging.WARNING)
 
 # Configuration for both Jira instances
 source_config = {
@@ -23,6 +35,20 @@ target_config = {
     'base_url': 'https://target.atlassian.net'
 }
 
+# HTTP statuses retried by both the synchronous session and the async fetches
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Shared session so the synchronous calls reuse pooled keep-alive connections instead of a new TLS handshake per request
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=RETRY_STATUSES)))
+
+# Response cache on disk, so reruns within the TTL skip the HTTP stage
+cache_config = {
+    'enabled': True,
+    'ttl': 300,
+    'dir': os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+}
+
 FIELD_TYPE_MAPPING = {
     "option": "Select List (Single Select)",
     "array": "Select List (Multiple Select)",
@@ -44,30 +70,30 @@ def get_user_display_name(config, account_id):
     auth = HTTPBasicAuth(config['email'], config['token'])
     headers = {"Accept": "application/json"}
     
-    response = requests.get(url, auth=auth, headers=headers)
+    response = SESSION.get(url, auth=auth, headers=headers)
     response.raise_for_status()
-    user_data = response.json()
+    user_data = orjson.loads(response.content)
     display_name = user_data.get('displayName', 'Unknown')
     email_address = user_data.get('emailAddress', 'Unknown')
     return f"{display_name} ({email_address})"
 
-def get_group_members(config, group_name, desc='Fetching group members'):
+def get_group_members(config, group_name, desc='Fetching group members', show_progress=True):
     start_at = 0
     max_results = 50
     members = []
 
     total_filtered = 0  # Track the total number of non-app users
     progress_desc = f"{desc} ({group_name})"
-    with tqdm(total=total_filtered, desc=progress_desc, ncols=100) as pbar:
+    with tqdm(total=total_filtered, desc=progress_desc, ncols=100, disable=not show_progress) as pbar:
         while True:
             try:
                 url = f"{config['base_url']}/rest/api/2/group/member?groupname={group_name}&startAt={start_at}&maxResults={max_results}"
                 auth = HTTPBasicAuth(config['email'], config['token'])
                 headers = {"Accept": "application/json"}
                 
-                response = requests.get(url, auth=auth, headers=headers)
+                response = SESSION.get(url, auth=auth, headers=headers)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # Filter out users where accountType is 'app'
                 filtered_members = [member for member in data.get('values', []) if member.get('accountType') != 'app']
@@ -103,106 +129,210 @@ def get_group_members(config, group_name, desc='Fetching group members'):
     
     return members
 
+# Worker threads for the synchronous requests; requests releases the GIL while waiting on sockets
+MAX_WORKERS = 16
+
 def get_all_users_by_license(application_roles, config, desc='Fetching users by license'):
     users_by_license = defaultdict(set)
     
-    for role in tqdm(application_roles, desc=desc, ncols=100):
-        # Combine both groups and defaultGroups
-        all_groups = set(role.get('groups', [])) | set(role.get('defaultGroups', []))
-        for group in all_groups:
-            members = get_group_members(config, group)
-            for member in members:
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for role in application_roles:
+            # Combine both groups and defaultGroups
+            all_groups = set(role.get('groups', [])) | set(role.get('defaultGroups', []))
+            for group in all_groups:
+                # The per-group bars would draw over each other from the worker threads, so only the outer bar is shown
+                futures[executor.submit(get_group_members, config, group, show_progress=False)] = role['name']
+
+        for future in tqdm(as_completed(futures), total=len(futures), desc=desc, ncols=100):
+            for member in future.result():
                 if 'accountId' in member:
-                    users_by_license[role['name']].add(member['accountId'])
+                    users_by_license[futures[future]].add(member['accountId'])
     
     return users_by_license
 
-# Function to get data from Jira instance with progress bar
-def get_jira_data(config, endpoint, desc='Fetching data'):
+# Maximum number of concurrent requests per Jira instance
+MAX_CONCURRENT_REQUESTS = 32
+# Maximum request rate per Jira instance and retries for throttled requests
+MAX_REQUESTS_PER_SECOND = 10
+MAX_RETRIES = 5
+
+# Token spacing per host, pushed back whenever Jira asks the client to slow down
+class HostRateLimiter:
+    def __init__(self, max_rate, time_period=1.0):
+        self.interval = time_period / max_rate
+        self.next_slot = defaultdict(float)
+
+    async def acquire(self, host):
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self.next_slot[host])
+        self.next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def pause(self, host, seconds):
+        now = asyncio.get_running_loop().time()
+        self.next_slot[host] = max(self.next_slot[host], now + seconds)
+
+rate_limiter = HostRateLimiter(MAX_REQUESTS_PER_SECOND)
+
+def get_retry_after(headers, default):
+    try:
+        return float(headers.get('Retry-After', default))
+    except (TypeError, ValueError):
+        return default
+
+# Decorator to retry throttled and transient server errors: 429/503 honour the Retry-After header and pause the host,
+# other retryable statuses back off exponentially for this request only
+def retry_on_throttle(func):
+    @functools.wraps(func)
+    async def wrapper(client, semaphores, config, endpoint):
+        for attempt in range(MAX_RETRIES):
+            try:
+                return await func(client, semaphores, config, endpoint)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status not in RETRY_STATUSES or attempt == MAX_RETRIES - 1:
+                    raise
+                if status in (429, 503):
+                    delay = get_retry_after(e.response.headers, 2 ** attempt)
+                    logging.warning(f"Throttled by {config['base_url']} ({status}), retrying {endpoint} in {delay}s")
+                    rate_limiter.pause(config['base_url'], delay)
+                else:
+                    delay = 2 ** attempt
+                    logging.warning(f"Server error from {config['base_url']} ({status}), retrying {endpoint} in {delay}s")
+                    await asyncio.sleep(delay)
+    return wrapper
+
+def get_cache_path(config, url):
+    key = hashlib.sha1(f"{config['email']} {url}".encode()).hexdigest()
+    return os.path.join(cache_config['dir'], f"{key}.json")
+
+# Function to read a cached response, ignoring entries older than the TTL
+def read_cache(config, url):
+    if not cache_config['enabled']:
+        return None
+    path = get_cache_path(config, url)
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < cache_config['ttl']:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    return None
+
+def write_cache(config, url, data):
+    if not cache_config['enabled']:
+        return
+    os.makedirs(cache_config['dir'], exist_ok=True)
+    with open(get_cache_path(config, url), 'wb') as f:
+        f.write(orjson.dumps(data))
+
+# Function to get data from a Jira endpoint asynchronously
+@retry_on_throttle
+async def fetch(client, semaphores, config, endpoint):
     url = f"{config['base_url']}{endpoint}"
-    auth = HTTPBasicAuth(config['email'], config['token'])
-    headers = {"Accept": "application/json"}
 
-    # Make the initial request to get the data
-    response = requests.get(url, auth=auth, headers=headers)
-    response.raise_for_status()
-    data = response.json()
+    cached = read_cache(config, url)
+    if cached is not None:
+        return cached
 
-    # Determine the number of elements to set the progress bar total
-    elements_count = len(data)
-    
-    with tqdm(total=elements_count, desc=desc, ncols=100) as pbar:
-        # Update the progress bar based on the number of elements
-        pbar.update(elements_count)
-        
+    async with semaphores[config['base_url']]:
+        await rate_limiter.acquire(config['base_url'])
+        response = await client.get(url, auth=(config['email'], config['token']))
+        # Slow down before Jira starts rejecting requests
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            rate_limiter.pause(config['base_url'], get_retry_after(response.headers, 1))
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+    write_cache(config, url, data)
     return data
 
-def search_filters(config, desc='Fetching filters'):
-    filters = []
-    start_at = 0
-    max_results = 50
-    total = 1
-    with tqdm(total=total, desc=desc, ncols=100) as pbar:
-        while True:
-            try:
-                url = f"{config['base_url']}/rest/api/2/filter/search?expand=description,owner,jql,sharePermissions,editPermissions&startAt={start_at}&maxResults={max_results}"
-                response = requests.get(url, headers={"Accept": "application/json"}, auth=HTTPBasicAuth(config['email'], config['token']))
-                response.raise_for_status()
-                data = response.json()
-                filters.extend(data.get('values', []))
-                start_at += max_results
-                if data.get('isLast', True):
-                    break
-                total = data.get('total', total)
-                pbar.total = total
-                pbar.update(len(data.get('values', [])))
-            except requests.exceptions.RequestException as e:
-                print(f"An error occurred: {e}")
-                break
-            except KeyError as e:
-                print(f"Missing expected key: {e}")
-                break
-            except Exception as e:
-                print(f"An unexpected error occurred: {e}")
-                break
-        pbar.n = total
-        pbar.last_print_n = total
-        pbar.close()
-    return filters
+# Function to fetch all endpoints from both instances concurrently with a progress bar
+async def fetch_endpoints(client, semaphores, configs, endpoints, desc='Fetching data'):
+    with tqdm(total=len(configs) * len(endpoints), desc=desc, ncols=100) as pbar:
+        async def fetch_one(config, key, endpoint):
+            data = await fetch(client, semaphores, config, endpoint)
+            pbar.update(1)
+            return key, data
 
-# Function to search dashboards with pagination and progress bar
-def search_dashboards(config, desc='Fetching dashboards'):
-    dashboards = []
-    start_at = 0
-    max_results = 50
-    total = 1
-    with tqdm(total=total, desc=desc, ncols=100) as pbar:
-        while True:
+        tasks = [fetch_one(config, key, endpoint) for config in configs for key, endpoint in endpoints.items()]
+        results = await asyncio.gather(*tasks)
+
+    # Split the flat result list back into one dictionary per instance
+    return [dict(results[i:i + len(endpoints)]) for i in range(0, len(results), len(endpoints))]
+
+# Generator over a paginated endpoint: the first page gives the total, the remaining pages are fetched
+# concurrently and yielded as (startAt, values) in completion order so callers can process them on arrival
+async def iter_pages(client, semaphores, config, endpoint, values_key, desc='Fetching pages', max_results=50):
+    separator = '&' if '?' in endpoint else '?'
+    page_semaphore = asyncio.BoundedSemaphore(8)
+
+    with tqdm(total=1, desc=desc, ncols=100) as pbar:
+        async def fetch_page(start_at):
+            # A missing page would silently skew the report, so log and abort instead of skipping it
             try:
-                url = f"{config['base_url']}/rest/api/2/dashboard?startAt={start_at}&maxResults={max_results}"
-                response = requests.get(url, headers={"Accept": "application/json"}, auth=HTTPBasicAuth(config['email'], config['token']))
-                response.raise_for_status()
-                data = response.json()
-                dashboards.extend(data.get('dashboards', []))
-                start_at += max_results
-                if data.get('isLast', True):
-                    break
-                total = data.get('total', total)
-                pbar.total = total
-                pbar.update(len(data.get('dashboards', [])))
-            except requests.exceptions.RequestException as e:
-                print(f"An error occurred: {e}")
-                break
-            except KeyError as e:
-                print(f"Missing expected key: {e}")
-                break
+                async with page_semaphore:
+                    data = await fetch(client, semaphores, config, f"{endpoint}{separator}startAt={start_at}&maxResults={max_results}")
             except Exception as e:
-                print(f"An unexpected error occurred: {e}")
-                break
-        pbar.n = total
-        pbar.last_print_n = total
-        pbar.close()
-    return [dashboard for dashboard in dashboards if dashboard['name'] != 'Default dashboard']
+                logging.error(f"Failed to fetch {endpoint} from {config['base_url']} at startAt={start_at}: {e}")
+                raise
+            pbar.update(len(data.get(values_key, [])))
+            return start_at, data
+
+        _, first_page = await fetch_page(0)
+        total = first_page['total']
+        pbar.total = total
+        pbar.refresh()
+        yield 0, first_page.get(values_key, [])
+
+        tasks = [asyncio.create_task(fetch_page(start_at)) for start_at in range(max_results, total, max_results)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                start_at, data = await next_page
+                yield start_at, data.get(values_key, [])
+        finally:
+            # Stop outstanding requests if a page failed or the consumer stopped early
+            for task in tasks:
+                task.cancel()
+            # Retrieve the outcome of every task so failures and cancellations are not reported as unhandled
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+# Function to keep only the item names from each page as it arrives, returned in offset order
+async def collect_names(pages):
+    names_by_offset = {}
+    async for start_at, values in pages:
+        names_by_offset[start_at] = [item['name'] for item in values]
+    return [name for start_at in sorted(names_by_offset) for name in names_by_offset[start_at]]
+
+# Function to search filter names with pagination and progress bar
+async def search_filters(client, semaphores, config, desc='Fetching filters'):
+    return await collect_names(iter_pages(client, semaphores, config, '/rest/api/2/filter/search', 'values', desc))
+
+# Function to search dashboard names with pagination and progress bar
+async def search_dashboards(client, semaphores, config, desc='Fetching dashboards'):
+    names = await collect_names(iter_pages(client, semaphores, config, '/rest/api/2/dashboard', 'dashboards', desc))
+    return [name for name in names if name != 'Default dashboard']
+
+# Function to fetch endpoints, filters and dashboards from both instances over a shared HTTP/2 client
+async def fetch_instances_data(source_config, target_config, endpoints):
+    # One semaphore per host so a slow instance cannot starve requests to the other
+    semaphores = {config['base_url']: asyncio.Semaphore(MAX_CONCURRENT_REQUESTS) for config in (source_config, target_config)}
+
+    # HTTP/2 multiplexes all requests to an instance over a single TLS connection
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    async with httpx.AsyncClient(http2=True, headers={"Accept": "application/json"}, limits=limits, timeout=60.0) as client:
+        (data_source, data_target), filters_source, filters_target, dashboards_source, dashboards_target = await asyncio.gather(
+            fetch_endpoints(client, semaphores, [source_config, target_config], endpoints, 'Fetching data from source and target'),
+            search_filters(client, semaphores, source_config, 'Fetching filters from source'),
+            search_filters(client, semaphores, target_config, 'Fetching filters from target'),
+            search_dashboards(client, semaphores, source_config, 'Fetching dashboards from source'),
+            search_dashboards(client, semaphores, target_config, 'Fetching dashboards from target'),
+        )
+
+    data_source['filters'] = filters_source
+    data_target['filters'] = filters_target
+    data_source['dashboards'] = dashboards_source
+    data_target['dashboards'] = dashboards_target
+    return data_source, data_target
 
 # Function to get notification schemes with pagination and progress bar
 def get_notification_schemes(config, desc='Fetching notification schemes'):
@@ -214,9 +344,9 @@ def get_notification_schemes(config, desc='Fetching notification schemes'):
         while True:
             try:
                 url = f"{config['base_url']}/rest/api/2/notificationscheme/project?startAt={start_at}&maxResults={max_results}"
-                response = requests.get(url, headers={"Accept": "application/json"}, auth=HTTPBasicAuth(config['email'], config['token']))
+                response = SESSION.get(url, headers={"Accept": "application/json"}, auth=HTTPBasicAuth(config['email'], config['token']))
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
                 notification_schemes.extend(data.get('values', []))
                 
                 # Update the progress bar
@@ -263,9 +393,9 @@ def get_notification_scheme_name(config, scheme_id):
         return notification_scheme_name_cache[scheme_id]
 
     url = f"{config['base_url']}/rest/api/2/notificationscheme/{scheme_id}"
-    response = requests.get(url, headers={"Accept": "application/json"}, auth=HTTPBasicAuth(config['email'], config['token']))
+    response = SESSION.get(url, headers={"Accept": "application/json"}, auth=HTTPBasicAuth(config['email'], config['token']))
     response.raise_for_status()
-    name = response.json().get('name')
+    name = orjson.loads(response.content).get('name')
     notification_scheme_name_cache[scheme_id] = name
     return name
 
@@ -278,122 +408,70 @@ def get_application_roles(config):
     headers = {"Accept": "application/json"}
     
     with tqdm(total=1, desc="Fetching application roles", ncols=100) as pbar:
-        response = requests.get(url, auth=auth, headers=headers)
+        response = SESSION.get(url, auth=auth, headers=headers)
         pbar.update(1)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
+# Set operations on the dict key views run in C; iterating the source keeps the API order (e.g. priority rank)
 def analyze_additions(source, target):
-    additions = {}
-    for key, value in source.items():
-        if key not in target:
-            additions[key] = value
-    return additions
+    keys = source.keys() - target.keys()
+    return {key: value for key, value in source.items() if key in keys}
 
 def analyze_merges(source, target):
-    merges = {}
-    for key, value in source.items():
-        if key in target:
-            merges[key] = value
-    return merges
+    keys = source.keys() & target.keys()
+    return {key: value for key, value in source.items() if key in keys}
+
+# Split the source items into additions (missing from target) and merges (present in both)
+def partition(source, target):
+    return analyze_additions(source, target), analyze_merges(source, target)
+
+# Function to add a table sized up front and filled by cell index, instead of growing it one add_row() at a time
+def add_filled_table(doc, headers, rows):
+    table = doc.add_table(rows=len(rows) + 1, cols=len(headers))
+    table.style = 'Table Grid'
+    cells = table._cells
+    cols = len(headers)
+    for col, header in enumerate(headers):
+        cells[col].text = header
+    for row_index, row in enumerate(rows, 1):
+        for col, value in enumerate(row):
+            cells[row_index * cols + col].text = value
+    return table
 
 # Section functions for each entity
 def add_projects_section(doc, source_data, target_data):
     source_count = len(source_data)
     target_count = len(target_data)
 
-    additions = analyze_additions({item['key']: item for item in source_data}, {item['key']: item for item in target_data})
-    conflicts = analyze_merges({item['key']: item for item in source_data}, {item['key']: item for item in target_data})
-    
+    source_projects = {item['key']: item for item in source_data}
+    target_projects = {item['key']: item for item in target_data}
+    additions, conflicts = partition(source_projects, target_projects)
+
     doc.add_heading('Projects', level=1)
     doc.add_paragraph(f"• Number of projects in source instance: {source_count}")
     doc.add_paragraph(f"• Number of projects in target instance: {target_count}")
 
     doc.add_heading('Items to be added to the target instance', level=2)
     if additions:
-        table = doc.add_table(rows=1, cols=3)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Key'
-        hdr_cells[1].text = 'Project Type Key'
-        hdr_cells[2].text = 'Style'
-        for addition_key, addition_data in additions.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = addition_key
-            row_cells[1].text = addition_data.get('projectTypeKey', 'N/A')
-            row_cells[2].text = addition_data.get('style', 'N/A')
+        rows = [(addition_key, addition_data.get('projectTypeKey', 'N/A'), addition_data.get('style', 'N/A')) for addition_key, addition_data in additions.items()]
+        add_filled_table(doc, ['Key', 'Project Type Key', 'Style'], rows)
     else:
         doc.add_paragraph("No items identified for addition.")
 
     if conflicts:
         doc.add_heading('Conflicting project keys requiring renaming for migration', level=2)
-        table = doc.add_table(rows=1, cols=5)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Key'
-        hdr_cells[1].text = 'Source Project Type Key'
-        hdr_cells[2].text = 'Source Style'
-        hdr_cells[3].text = 'Target Project Type Key'
-        hdr_cells[4].text = 'Target Style'
-        
-        for conflict_key, conflict_data in conflicts.items():
-            source_project = next(item for item in source_data if item['key'] == conflict_key)
-            target_project = next(item for item in target_data if item['key'] == conflict_key)
-            
-            row_cells = table.add_row().cells
-            row_cells[0].text = conflict_key
-            row_cells[1].text = source_project.get('projectTypeKey', 'N/A')
-            row_cells[2].text = source_project.get('style', 'N/A')
-            row_cells[3].text = target_project.get('projectTypeKey', 'N/A')
-            row_cells[4].text = target_project.get('style', 'N/A')
-
-def add_priorities_section(doc, source_data, target_data):
-    analyze_and_add_section(doc, 'Priorities', source_data, target_data, 'name')
-
-def add_resolutions_section(doc, source_data, target_data):
-    analyze_and_add_section(doc, 'Resolutions', source_data, target_data, 'name')
-
-def add_roles_section(doc, source_data, target_data):
-    source_roles = {role['name']: role.get('description', 'No description') for role in source_data}
-    target_roles = {role['name']: role.get('description', 'No description') for role in target_data}
-
-    additions = analyze_additions(source_roles, target_roles)
-    merges = analyze_merges(source_roles, target_roles)
-
-    doc.add_heading('Project Roles', level=1)
-    doc.add_paragraph(f"• Number of project roles in source instance: {len(source_roles)}")
-    doc.add_paragraph(f"• Number of project roles in target instance: {len(target_roles)}")
-
-    doc.add_heading('Roles to be added to the target instance', level=2)
-    if additions:
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Description'
-        for addition_name, addition_description in additions.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = addition_name
-            row_cells[1].text = addition_description
-    else:
-        doc.add_paragraph("No roles identified for addition.")
-
-    doc.add_heading('Roles to be merged due to presence in both instances', level=2)
-    if merges:
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Description'
-        for merge_name, merge_description in merges.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = merge_name
-            row_cells[1].text = merge_description
-    else:
-        doc.add_paragraph("No roles identified for merging.")
-
-def add_issuetypes_section(doc, source_data, target_data):
-    analyze_and_add_section(doc, 'Issue Types', source_data, target_data, 'name')
+        rows = []
+        for conflict_key, source_project in conflicts.items():
+            target_project = target_projects[conflict_key]
+            rows.append((
+                conflict_key,
+                source_project.get('projectTypeKey', 'N/A'),
+                source_project.get('style', 'N/A'),
+                target_project.get('projectTypeKey', 'N/A'),
+                target_project.get('style', 'N/A'),
+            ))
+        add_filled_table(doc, ['Key', 'Source Project Type Key', 'Source Style', 'Target Project Type Key', 'Target Style'], rows)
 
 def add_filters_section(doc, source_data, target_data):
     source_count = len(source_data)
@@ -404,7 +482,8 @@ def add_filters_section(doc, source_data, target_data):
     doc.add_paragraph(f"• Number of filters in target instance: {target_count}")
 
     doc.add_heading('Conflicting filters (same name in both instances)', level=2)
-    conflicts = [item['name'] for item in source_data if item['name'] in [i['name'] for i in target_data]]
+    target_names = set(target_data)
+    conflicts = [name for name in source_data if name in target_names]
     if conflicts:
         for conflict in conflicts:
             doc.add_paragraph(f"• {conflict}")
@@ -420,7 +499,8 @@ def add_dashboards_section(doc, source_data, target_data):
     doc.add_paragraph(f"• Number of dashboards in target instance: {target_count}")
 
     doc.add_heading('Conflicting dashboards (same name in both instances)', level=2)
-    conflicts = [item['name'] for item in source_data if item['name'] in [i['name'] for i in target_data]]
+    target_names = set(target_data)
+    conflicts = [name for name in source_data if name in target_names]
     if conflicts:
         for conflict in conflicts:
             doc.add_paragraph(f"• {conflict}")
@@ -455,15 +535,8 @@ def add_custom_fields_section(doc, source_data, target_data):
     doc.add_heading('Custom fields to be added', level=2)
     additions = {name: source_type for name, source_type in source_fields.items() if name not in target_fields and source_type not in non_migratable_types}
     if additions:
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Source Type'
-        for name, source_type in additions.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = name
-            row_cells[1].text = get_readable_field_type(source_type)
+        rows = [(name, get_readable_field_type(source_type)) for name, source_type in additions.items()]
+        add_filled_table(doc, ['Name', 'Source Type'], rows)
     else:
         doc.add_paragraph("No custom fields identified for addition.")
 
@@ -471,18 +544,8 @@ def add_custom_fields_section(doc, source_data, target_data):
     doc.add_heading('Custom fields with identical names in both instances', level=2)
     merges = {name: source_type for name, source_type in source_fields.items() if name in target_fields and source_type != target_fields[name]}
     if merges:
-        table = doc.add_table(rows=1, cols=3)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Source Type'
-        hdr_cells[2].text = 'Target Type'
-        for name, source_type in merges.items():
-            target_type = target_fields.get(name, 'N/A')
-            row_cells = table.add_row().cells
-            row_cells[0].text = name
-            row_cells[1].text = get_readable_field_type(source_type)
-            row_cells[2].text = get_readable_field_type(target_type)
+        rows = [(name, get_readable_field_type(source_type), get_readable_field_type(target_fields.get(name, 'N/A'))) for name, source_type in merges.items()]
+        add_filled_table(doc, ['Name', 'Source Type', 'Target Type'], rows)
     else:
         doc.add_paragraph("No custom fields with identical names found in both instances with differing types.")
 
@@ -490,15 +553,8 @@ def add_custom_fields_section(doc, source_data, target_data):
     doc.add_heading('Custom fields that will not be migrated', level=2)
     non_migratable = {name: source_type for name, source_type in source_fields.items() if source_type in non_migratable_types}
     if non_migratable:
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Type'
-        for name, source_type in non_migratable.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = name
-            row_cells[1].text = get_readable_field_type(source_type)
+        rows = [(name, get_readable_field_type(source_type)) for name, source_type in non_migratable.items()]
+        add_filled_table(doc, ['Name', 'Type'], rows)
     else:
         doc.add_paragraph("No custom fields identified for exclusion from migration.")
 
@@ -512,54 +568,40 @@ def add_statuses_section(doc, source_data, target_data):
     doc.add_paragraph(f"• Number of statuses in source instance: {source_count}")
     doc.add_paragraph(f"• Number of statuses in target instance: {target_count}")
 
+    source_statuses = {status['name']: status['statusCategory']['name'] for status in source_data}
+    target_statuses = {status['name']: status['statusCategory']['name'] for status in target_data}
+    additions, merges = partition(source_statuses, target_statuses)
+
     # Additions table
     doc.add_heading('Statuses to be added', level=2)
-    additions = analyze_additions({status['name']: status['statusCategory']['name'] for status in source_data}, {status['name']: status['statusCategory']['name'] for status in target_data})
     if additions:
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Category'
-        for addition_name, addition_category in additions.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = addition_name
-            row_cells[1].text = addition_category
+        add_filled_table(doc, ['Name', 'Category'], list(additions.items()))
     else:
         doc.add_paragraph("No statuses identified for addition.")
 
     # Conflicts table
     doc.add_heading('Statuses with identical names but different categories', level=2)
-    source_statuses = {status['name']: status['statusCategory']['name'] for status in source_data}
-    target_statuses = {status['name']: status['statusCategory']['name'] for status in target_data}
-    conflicts = {name: source_category for name, source_category in source_statuses.items() if name in target_statuses and source_category != target_statuses[name]}
+    conflicts = {name: source_category for name, source_category in merges.items() if source_category != target_statuses[name]}
     if conflicts:
-        table = doc.add_table(rows=1, cols=4)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Source Category'
-        hdr_cells[2].text = 'Target Category'
-        hdr_cells[3].text = 'Suggestion'
-        for name, source_category in conflicts.items():
-            target_category = target_statuses[name]
-            suggestion = 'Change category or Merge'
-            row_cells = table.add_row().cells
-            row_cells[0].text = name
-            row_cells[1].text = source_category
-            row_cells[2].text = target_category
-            row_cells[3].text = suggestion
+        rows = [(name, source_category, target_statuses[name], 'Change category or Merge') for name, source_category in conflicts.items()]
+        add_filled_table(doc, ['Name', 'Source Category', 'Target Category', 'Suggestion'], rows)
     else:
         doc.add_paragraph("No statuses with identical names found but differing categories.")
 
 def add_notification_schemes_section(doc, source_schemes, target_schemes, projects_data, config):
     doc.add_heading('Notification Schemes', level=1)
 
+    # Resolve the distinct scheme names in parallel to fill the name cache
+    scheme_ids = {scheme['notificationSchemeId'] for scheme in source_schemes}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(executor.map(lambda scheme_id: get_notification_scheme_name(config, scheme_id), scheme_ids))
+
     # Aggregate projects under the same notification scheme
+    project_names = {project['id']: project['name'] for project in projects_data}
     scheme_to_projects = defaultdict(list)
     for scheme in source_schemes:
         scheme_name = get_notification_scheme_name(config, scheme['notificationSchemeId'])
-        project_name = next((project['name'] for project in projects_data if project['id'] == scheme['projectId']), 'Unknown Project')
+        project_name = project_names.get(scheme['projectId'], 'Unknown Project')
         scheme_to_projects[scheme_name].append(project_name)
 
     source_count = len(scheme_to_projects)
@@ -570,15 +612,8 @@ def add_notification_schemes_section(doc, source_schemes, target_schemes, projec
 
     doc.add_heading('Notification Schemes and Associated Projects', level=2)
     if scheme_to_projects:
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Notification Scheme'
-        hdr_cells[1].text = 'Project(s)'
-        for scheme_name, projects in scheme_to_projects.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = scheme_name
-            row_cells[1].text = ', '.join(projects)
+        rows = [(scheme_name, ', '.join(projects)) for scheme_name, projects in scheme_to_projects.items()]
+        add_filled_table(doc, ['Notification Scheme', 'Project(s)'], rows)
     else:
         doc.add_paragraph("No notification schemes identified in the source instance.")
     
@@ -591,32 +626,27 @@ def add_licenses_section(doc, source_application_roles, target_application_roles
     def add_table(doc, application_roles, heading):
         if application_roles:
             doc.add_heading(heading, level=2)
-            table = doc.add_table(rows=1, cols=6)
-            table.style = 'Table Grid'
-            hdr_cells = table.rows[0].cells
-            hdr_cells[0].text = 'Application'
-            hdr_cells[1].text = 'Number of Seats'
-            hdr_cells[2].text = 'Remaining Seats'
-            hdr_cells[3].text = 'User Count'
-            hdr_cells[4].text = 'Default Groups'
-            hdr_cells[5].text = 'All Groups'
             
             total_seats = 0
             total_remaining_seats = 0
             total_user_count = 0
+            rows = []
             
             for role in application_roles:
                 total_seats += role['numberOfSeats']
                 total_remaining_seats += role['remainingSeats']
                 total_user_count += role['userCount']
                 
-                row_cells = table.add_row().cells
-                row_cells[0].text = role['name']
-                row_cells[1].text = str(role['numberOfSeats'])
-                row_cells[2].text = str(role['remainingSeats'])
-                row_cells[3].text = f"{role['userCount']} ({role['userCountDescription']})"
-                row_cells[4].text = ', '.join(role['defaultGroups'])
-                row_cells[5].text = ', '.join(role['groups'])
+                rows.append((
+                    role['name'],
+                    str(role['numberOfSeats']),
+                    str(role['remainingSeats']),
+                    f"{role['userCount']} ({role['userCountDescription']})",
+                    ', '.join(role['defaultGroups']),
+                    ', '.join(role['groups']),
+                ))
+
+            add_filled_table(doc, ['Application', 'Number of Seats', 'Remaining Seats', 'User Count', 'Default Groups', 'All Groups'], rows)
 
             doc.add_paragraph(f"Total number of seats: {total_seats}")
             doc.add_paragraph(f"Total remaining seats: {total_remaining_seats}")
@@ -627,9 +657,12 @@ def add_licenses_section(doc, source_application_roles, target_application_roles
     add_table(doc, source_application_roles, "Source Instance")
     add_table(doc, target_application_roles, "Target Instance")
 
-    # Get all users by license for source and target instances
-    source_users_by_license = get_all_users_by_license(source_application_roles, source_config, 'Fetching users by license (source)')
-    target_users_by_license = get_all_users_by_license(target_application_roles, target_config, 'Fetching users by license (target)')
+    # Get all users by license for source and target instances in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_future = executor.submit(get_all_users_by_license, source_application_roles, source_config, 'Fetching users by license (source)')
+        target_future = executor.submit(get_all_users_by_license, target_application_roles, target_config, 'Fetching users by license (target)')
+    source_users_by_license = source_future.result()
+    target_users_by_license = target_future.result()
 
     # Find common users in both instances
     common_users = {}
@@ -641,20 +674,13 @@ def add_licenses_section(doc, source_application_roles, target_application_roles
     # Create table for common users
     doc.add_heading('Common Users and License Savings', level=1)
     if common_users:
-        table = doc.add_table(rows=1, cols=3)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'License Type'
-        hdr_cells[1].text = 'User'
-        hdr_cells[2].text = 'Savings'
-
-        for license_type, users in common_users.items():
-            for user in users:
-                user_display_name = get_user_display_name(source_config, user)
-                row_cells = table.add_row().cells
-                row_cells[0].text = license_type
-                row_cells[1].text = user_display_name
-                row_cells[2].text = '1 License'  # Since merging will save one license per user
+        common_user_rows = [(license_type, user) for license_type, users in common_users.items() for user in users]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            user_display_names = list(executor.map(lambda row: get_user_display_name(source_config, row[1]), common_user_rows))
+
+        # Merging saves one license per common user
+        rows = [(license_type, user_display_name, '1 License') for (license_type, user), user_display_name in zip(common_user_rows, user_display_names)]
+        add_filled_table(doc, ['License Type', 'User', 'Savings'], rows)
 
         total_savings = sum(len(users) for users in common_users.values())
         doc.add_paragraph(f"Total Savings: {total_savings} licenses")
@@ -663,14 +689,9 @@ def add_licenses_section(doc, source_application_roles, target_application_roles
     
     # Calculate remaining seats if all users are transferred from source to target
     doc.add_heading('Remaining Seats After Transfer', level=1)
-    table = doc.add_table(rows=1, cols=5)
-    table.style = 'Table Grid'
-    hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'License Type'
-    hdr_cells[1].text = 'Total Users in Source'
-    hdr_cells[2].text = 'Total Users in Target'
-    hdr_cells[3].text = 'Total Users After Migration'
-    hdr_cells[4].text = 'Remaining Seats After Transfer'
+    source_roles = {role['name']: role for role in source_application_roles}
+    target_roles = {role['name']: role for role in target_application_roles}
+    rows = []
 
     with tqdm(total=len(source_users_by_license) + len(target_users_by_license), desc='Calculating remaining seats', ncols=100) as pbar:
         for license_type, source_users in source_users_by_license.items():
@@ -679,79 +700,51 @@ def add_licenses_section(doc, source_application_roles, target_application_roles
                 common_users_set = source_users & target_users
                 unique_source_users = source_users - common_users_set
                 total_users_after_transfer = len(unique_source_users) + len(target_users)
-                target_role = next(role for role in target_application_roles if role['name'] == license_type)
+                target_role = target_roles[license_type]
                 remaining_seats_after_transfer = target_role['numberOfSeats'] - total_users_after_transfer
 
-                row_cells = table.add_row().cells
-                row_cells[0].text = license_type
-                row_cells[1].text = str(len(source_users))
-                row_cells[2].text = str(len(target_users))
-                row_cells[3].text = str(len(unique_source_users))
-                row_cells[4].text = str(remaining_seats_after_transfer)
+                rows.append((license_type, str(len(source_users)), str(len(target_users)), str(len(unique_source_users)), str(remaining_seats_after_transfer)))
             else:
                 # Handle cases where the license type exists only in the source
                 unique_source_users = source_users
                 total_users_after_transfer = len(unique_source_users)
-                source_role = next(role for role in source_application_roles if role['name'] == license_type)
+                source_role = source_roles[license_type]
                 remaining_seats_after_transfer = source_role['numberOfSeats'] - total_users_after_transfer
 
-                row_cells = table.add_row().cells
-                row_cells[0].text = license_type
-                row_cells[1].text = str(len(source_users))
-                row_cells[2].text = '0'
-                row_cells[3].text = str(len(unique_source_users))
-                row_cells[4].text = str(remaining_seats_after_transfer)
+                rows.append((license_type, str(len(source_users)), '0', str(len(unique_source_users)), str(remaining_seats_after_transfer)))
             pbar.update(1)
 
         for license_type, target_users in target_users_by_license.items():
             if license_type not in source_users_by_license:
-                row_cells = table.add_row().cells
-                row_cells[0].text = license_type
-                row_cells[1].text = '0'
-                row_cells[2].text = str(len(target_users))
-                row_cells[3].text = '0'
-                target_role = next(role for role in target_application_roles if role['name'] == license_type)
+                target_role = target_roles[license_type]
                 remaining_seats_after_transfer = target_role['numberOfSeats'] - len(target_users)
-                row_cells[4].text = str(remaining_seats_after_transfer)
+                rows.append((license_type, '0', str(len(target_users)), '0', str(remaining_seats_after_transfer)))
             pbar.update(1)
 
+    add_filled_table(doc, ['License Type', 'Total Users in Source', 'Total Users in Target', 'Total Users After Migration', 'Remaining Seats After Transfer'], rows)
 
-# Function to analyze and add sections for all required entities
-def analyze_and_add_section(doc, title, source_data, target_data, key_attr):
-    source_count = len(source_data)
-    target_count = len(target_data)
 
-    additions = analyze_additions({item[key_attr]: item.get('description', 'No description') for item in source_data}, {item[key_attr]: item.get('description', 'No description') for item in target_data})
-    merges = analyze_merges({item[key_attr]: item.get('description', 'No description') for item in source_data}, {item[key_attr]: item.get('description', 'No description') for item in target_data})
-    
+# Function to analyze and add a section comparing items by key, listing additions and merges
+def add_section(doc, title, source_data, target_data, key_attr, value_fn=lambda item: item.get('description', 'No description'), value_header='Description', item_label='items'):
+    source_map = {item[key_attr]: value_fn(item) for item in source_data}
+    target_map = {item[key_attr]: value_fn(item) for item in target_data}
+    additions, merges = partition(source_map, target_map)
+
     doc.add_heading(title, level=1)
-    doc.add_paragraph(f"• Number of {title.lower()} in source instance: {source_count}")
-    doc.add_paragraph(f"• Number of {title.lower()} in target instance: {target_count}")
+    doc.add_paragraph(f"• Number of {title.lower()} in source instance: {len(source_data)}")
+    doc.add_paragraph(f"• Number of {title.lower()} in target instance: {len(target_data)}")
 
-    doc.add_heading('Items to be added to the target instance', level=2)
+    doc.add_heading(f"{item_label.capitalize()} to be added to the target instance", level=2)
     if additions:
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Name'
-        hdr_cells[1].text = 'Description'
-        for addition_name, addition_description in additions.items():
-            row_cells = table.add_row().cells
-            row_cells[0].text = addition_name
-            row_cells[1].text = addition_description
+        add_filled_table(doc, ['Name', value_header], list(additions.items()))
     else:
-        doc.add_paragraph("No items identified for addition.")
+        doc.add_paragraph(f"No {item_label} identified for addition.")
 
-    doc.add_heading('Items to be merged due to presence in both instances', level=2)
-    table = doc.add_table(rows=1, cols=2)
-    table.style = 'Table Grid'
-    hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Name'
-    hdr_cells[1].text = 'Description'
-    for merge_name, merge_description in merges.items():
-        row_cells = table.add_row().cells
-        row_cells[0].text = merge_name
-        row_cells[1].text = merge_description
+    doc.add_heading(f"{item_label.capitalize()} to be merged due to presence in both instances", level=2)
+    if merges:
+        add_filled_table(doc, ['Name', value_header], list(merges.items()))
+    else:
+        doc.add_paragraph(f"No {item_label} identified for merging.")
 
 # Function to add sections for selected plugins
 def add_plugins_section(doc, selected_plugins):
@@ -760,9 +753,17 @@ def add_plugins_section(doc, selected_plugins):
         doc.add_paragraph(f"Details about {plugin} plugin...")  # Customize this as needed
 
 
+# Parse command line options
+parser = argparse.ArgumentParser(description='Analyze a source and a target Jira Cloud instance and generate a migration report.')
+parser.add_argument('--no-cache', action='store_true', help='Ignore cached responses and always fetch fresh data')
+parser.add_argument('--ttl', type=int, default=cache_config['ttl'], help=f"Seconds a cached response stays valid (default: {cache_config['ttl']})")
+args = parser.parse_args()
+cache_config['enabled'] = not args.no_cache
+cache_config['ttl'] = args.ttl
+
 # Define endpoints for required data
 endpoints = {
-    'projects': '/rest/api/3/project?expand=description,lead',
+    'projects': '/rest/api/3/project',
     'priorities': '/rest/api/3/priority',
     'resolutions': '/rest/api/3/resolution',
     'roles': '/rest/api/3/role',
@@ -795,23 +796,20 @@ questions = [
 answers = inquirer.prompt(questions)
 selected_apps = answers.get('apps', [])
  
-# Fetch data from both instances with progress bars
-data_source = {key: get_jira_data(source_config, endpoint, f"Fetching {key} from source") for key, endpoint in endpoints.items()}
-data_target = {key: get_jira_data(target_config, endpoint, f"Fetching {key} from target") for key, endpoint in endpoints.items()}
-
-# Fetch filters and dashboards with pagination and progress bars
-data_source['filters'] = search_filters(source_config, 'Fetching filters from source')
-data_target['filters'] = search_filters(target_config, 'Fetching filters from target')
-data_source['dashboards'] = search_dashboards(source_config, 'Fetching dashboards from source')
-data_target['dashboards'] = search_dashboards(target_config, 'Fetching dashboards from target')
+# Fetch data, filters and dashboards from both instances concurrently
+data_source, data_target = asyncio.run(fetch_instances_data(source_config, target_config, endpoints))
 
-# Fetch notification schemes with pagination and progress bars
-notification_schemes_source = get_notification_schemes(source_config, 'Fetching notification schemes from source')
-notification_schemes_target = get_notification_schemes(target_config, 'Fetching notification schemes from target')
+# Fetch notification schemes and application roles (licenses) from both instances in parallel
+with ThreadPoolExecutor(max_workers=4) as executor:
+    notification_schemes_source_future = executor.submit(get_notification_schemes, source_config, 'Fetching notification schemes from source')
+    notification_schemes_target_future = executor.submit(get_notification_schemes, target_config, 'Fetching notification schemes from target')
+    application_roles_source_future = executor.submit(get_application_roles, source_config)
+    application_roles_target_future = executor.submit(get_application_roles, target_config)
 
-# Fetch application roles (licenses)
-application_roles_source = get_application_roles(source_config)
-application_roles_target = get_application_roles(target_config)
+notification_schemes_source = notification_schemes_source_future.result()
+notification_schemes_target = notification_schemes_target_future.result()
+application_roles_source = application_roles_source_future.result()
+application_roles_target = application_roles_target_future.result()
 
 # Create a new Document
 doc = Document()
@@ -851,7 +849,7 @@ for title, key, attr in sections:
                 logging.error(f"Failed to analyze {title}: {e}")
         elif title == 'Project Roles':
             try:
-                add_roles_section(doc, data_source[key], data_target[key])
+                add_section(doc, title, data_source[key], data_target[key], attr, item_label='roles')
             except Exception as e:
                 logging.error(f"Failed to analyze {title}: {e}")
         elif title == 'Licenses':
@@ -881,7 +879,7 @@ for title, key, attr in sections:
                 logging.error(f"Failed to analyze {title}: {e}")
         else:
             try:
-                analyze_and_add_section(doc, title, data_source[key], data_target[key], attr)
+                add_section(doc, title, data_source[key], data_target[key], attr)
             except Exception as e:
                 logging.error(f"Failed to analyze {title}: {e}")
     except Exception as e: